@@ -1,9 +1,11 @@
+import hmac
 import os
 from flask import Flask, render_template, request, jsonify, abort
 from flask_compress import Compress
 from backend.qa.engine import resolve_query, resolve_by_answer_id, get_autocomplete
-from backend.qa.chips import CHIPS
 from backend.modules import get_module, get_practice
+from backend.reload import ContentWatcher, reload_content, reload_status
+from backend.snapshot import current
 
 app = Flask(
     __name__,
@@ -147,12 +149,38 @@ def api_suggestions():
 
 @app.route('/api/chips')
 def api_chips():
-    return jsonify(CHIPS)
+    return jsonify(list(current().chips))
+
+# -- Admin: content hot-reload -------------------------------------
+# Disabled (404) unless ADMIN_TOKEN is set; callers send it as X-Admin-Token.
+
+def _require_admin():
+    token = os.environ.get('ADMIN_TOKEN', '')
+    if not token:
+        abort(404)
+    given = request.headers.get('X-Admin-Token', '')
+    # compare_digest rejects non-ASCII str, so compare bytes
+    if not hmac.compare_digest(given.encode('utf-8'), token.encode('utf-8')):
+        abort(403)
+
+@app.route('/api/admin/reload', methods=['POST'])
+def api_admin_reload():
+    _require_admin()
+    status = reload_content()
+    return jsonify(status), (500 if status['error'] else 200)
+
+@app.route('/api/admin/content')
+def api_admin_content():
+    _require_admin()
+    return jsonify(reload_status())
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     if os.environ.get('FLASK_DEBUG', '1') == '0':
         from waitress import serve
+        current()  # build content before the first request
+        if os.environ.get('CONTENT_WATCH', '1') != '0':
+            ContentWatcher().start()
         print(f'Serving on http://0.0.0.0:{port} (waitress)')
         serve(app, host='0.0.0.0', port=port, threads=4)
     else:
@@ -2,6 +2,7 @@
 AWM Institute of Technology — Module Loader
 ============================================
 Imports all per-module registries and builds the combined MODULES dict.
+Lookups go through the live content snapshot so hot-reloads are picked up.
 
 Registry files for building_smartsdk and advanced_copilot_patterns are kept
 in their folders for future use — they just aren't loaded here yet.
@@ -13,6 +14,7 @@ from backend.modules.copilot_basics.registry import MODULE as _copilot_basics
 # from backend.modules.building_smartsdk.registry import MODULE as _building_smartsdk
 # from backend.modules.advanced_copilot_patterns.registry import MODULE as _advanced_copilot
 from backend.modules.flask_dashboard_practice.registry import PRACTICE as _flask_dashboard
+from backend.snapshot import current
 
 MODULES = {
     'copilot-basics': _copilot_basics,
@@ -27,19 +29,19 @@ PRACTICES = {
 
 def get_module(slug):
     """Return module dict or None."""
-    return MODULES.get(slug)
+    return current().modules.get(slug)
 
 
 def get_all_modules():
     """Return all modules as list of (slug, data) tuples."""
-    return list(MODULES.items())
+    return list(current().modules.items())
 
 
 def get_practice(slug):
     """Return practice dict or None."""
-    return PRACTICES.get(slug)
+    return current().practices.get(slug)
 
 
 def get_all_practices():
     """Return all practices as list of (slug, data) tuples."""
-    return list(PRACTICES.items())
+    return list(current().practices.items())
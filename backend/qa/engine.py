@@ -5,11 +5,8 @@ Ported from the original JavaScript matching logic.
 """
 
 import re
-from backend.qa import (
-    answer_bank, suggestion_bank, qa_bank,
-    module_banks, video_bank, next_questions_bank,
-    answer_module_map,
-)
+from backend.qa.paraphrase import ParaphraseIndex
+from backend.snapshot import current
 
 
 def normalize(query: str) -> str:
@@ -40,12 +37,13 @@ def _score_keywords(normalized_query: str, keywords: list[str]) -> int:
     return score
 
 
-def _build_answer(aid: str, text: str, module_slug: str | None = None) -> dict:
+def _build_answer(snap, aid: str, text: str, module_slug: str | None = None) -> dict:
     """Build an answer response, attaching video metadata if available."""
+    module_banks = snap.module_banks
     result = {'type': 'answer', 'answerId': aid, 'text': text}
     # Standalone chat: attach module reference so the frontend can render a link
-    if not module_slug and aid in answer_module_map:
-        mod = answer_module_map[aid]
+    if not module_slug and aid in snap.answer_module_map:
+        mod = snap.answer_module_map[aid]
         result['moduleRef'] = {
             'name': mod['name'],
             'url': '/modules/' + mod['slug'],
@@ -55,7 +53,7 @@ def _build_answer(aid: str, text: str, module_slug: str | None = None) -> dict:
     if module_slug and module_slug in module_banks:
         video = module_banks[module_slug].get('videos', {}).get(aid)
     if not video:
-        video = video_bank.get(aid)
+        video = snap.video_bank.get(aid)
     if video:
         result['video'] = video
     # Attach suggested next questions
@@ -63,12 +61,65 @@ def _build_answer(aid: str, text: str, module_slug: str | None = None) -> dict:
     if module_slug and module_slug in module_banks:
         nq = module_banks[module_slug].get('next_questions', {}).get(aid)
     if not nq:
-        nq = next_questions_bank.get(aid)
+        nq = snap.next_questions_bank.get(aid)
     if nq:
         result['nextQuestions'] = nq
     return result
 
 
+def _best_entry(normalized_query: str, entries: list[dict]) -> tuple[dict | None, int]:
+    """Return the highest-scoring QA entry and its keyword score."""
+    best_entry = None
+    best_score = 0
+    for entry in entries:
+        s = _score_keywords(normalized_query, entry.get('keywords', []))
+        if s > best_score:
+            best_score = s
+            best_entry = entry
+    return best_entry, best_score
+
+
+def _build_paraphrase_index(active_qa, active_suggestions) -> ParaphraseIndex:
+    """Index QA keywords, plus suggestion text under the entry it resolves to."""
+    documents = []
+    for entry in active_qa:
+        documents.append((entry, normalize(' '.join(entry.get('keywords', [])))))
+    for suggestion in active_suggestions:
+        text = normalize(suggestion.get('text', ''))
+        entry, score = _best_entry(text, active_qa)
+        if entry and score >= 5:
+            extra = normalize(' '.join(suggestion.get('keywords', [])))
+            documents.append((entry, text))
+            if extra:
+                documents.append((entry, extra))
+    return ParaphraseIndex(documents)
+
+
+def build_paraphrase_indexes(qa_bank, suggestion_bank, module_banks) -> dict:
+    """Build one paraphrase index per scope (module slug, or None for global)."""
+    indexes = {None: _build_paraphrase_index(qa_bank, suggestion_bank)}
+    for slug, banks in module_banks.items():
+        indexes[slug] = _build_paraphrase_index(banks['qa_entries'], banks['suggestions'])
+    return indexes
+
+
+def _entry_response(snap, entry: dict, active_answers: dict,
+                    module_slug: str | None) -> dict | None:
+    """Turn a matched QA entry into a followUp or answer response."""
+    if 'followUp' in entry:
+        fu = entry['followUp']
+        return {
+            'type': 'followUp',
+            'question': fu['question'],
+            'options': fu['options'],
+        }
+    aid = entry.get('answer', '')
+    text = active_answers.get(aid, '')
+    if text:
+        return _build_answer(snap, aid, text, module_slug)
+    return None
+
+
 def resolve_query(query: str, pending_follow_up: dict | None = None,
                   module_slug: str | None = None) -> dict:
     """
@@ -78,20 +129,27 @@ def resolve_query(query: str, pending_follow_up: dict | None = None,
       { 'type': 'noMatch' }
 
     When module_slug is provided, resolves against that module's
-    scoped banks instead of the global banks.
+    scoped banks instead of the global banks.  If no entry shares enough
+    keywords with the query, the scope's paraphrase index is consulted
+    before giving up.
     """
     nq = normalize(query)
     if not nq:
         return {'type': 'noMatch'}
 
+    # One snapshot for the whole request, so a reload can't split it
+    snap = current()
+
     # Select banks based on scope
-    if module_slug and module_slug in module_banks:
-        banks = module_banks[module_slug]
+    if module_slug and module_slug in snap.module_banks:
+        scope = module_slug
+        banks = snap.module_banks[module_slug]
         active_answers = banks['answers']
         active_qa = banks['qa_entries']
     else:
-        active_answers = answer_bank
-        active_qa = qa_bank
+        scope = None
+        active_answers = snap.answer_bank
+        active_qa = snap.qa_bank
 
     # If there's a pending follow-up, try to match against its options first
     if pending_follow_up:
@@ -107,40 +165,31 @@ def resolve_query(query: str, pending_follow_up: dict | None = None,
             aid = best_opt.get('answerId', '')
             text = active_answers.get(aid, '')
             if text:
-                return _build_answer(aid, text, module_slug)
+                return _build_answer(snap, aid, text, module_slug)
 
     # Score against QA entries (scoped or global)
-    best_entry = None
-    best_score = 0
-    for entry in active_qa:
-        s = _score_keywords(nq, entry.get('keywords', []))
-        if s > best_score:
-            best_score = s
-            best_entry = entry
-
+    best_entry, best_score = _best_entry(nq, active_qa)
     if best_entry and best_score >= 5:
-        # Check if it's a follow-up entry
-        if 'followUp' in best_entry:
-            fu = best_entry['followUp']
-            return {
-                'type': 'followUp',
-                'question': fu['question'],
-                'options': fu['options'],
-            }
-        # Single-turn answer
-        aid = best_entry.get('answer', '')
-        text = active_answers.get(aid, '')
-        if text:
-            return _build_answer(aid, text, module_slug)
+        result = _entry_response(snap, best_entry, active_answers, module_slug)
+        if result:
+            return result
+
+    # Keyword miss — fall back to the nearest paraphrase above threshold
+    near_entry, _ = snap.paraphrase_indexes[scope].nearest(nq)
+    if near_entry:
+        result = _entry_response(snap, near_entry, active_answers, module_slug)
+        if result:
+            return result
 
     return {'type': 'noMatch'}
 
 
 def resolve_by_answer_id(answer_id: str) -> dict:
     """Direct lookup for follow-up button clicks."""
-    text = answer_bank.get(answer_id, '')
+    snap = current()
+    text = snap.answer_bank.get(answer_id, '')
     if text:
-        return _build_answer(answer_id, text)
+        return _build_answer(snap, answer_id, text)
     return {'type': 'noMatch'}
 
 
@@ -151,10 +200,11 @@ def get_autocomplete(query: str, limit: int = 5,
     if not nq:
         return []
 
-    if module_slug and module_slug in module_banks:
-        active_suggestions = module_banks[module_slug]['suggestions']
+    snap = current()
+    if module_slug and module_slug in snap.module_banks:
+        active_suggestions = snap.module_banks[module_slug]['suggestions']
     else:
-        active_suggestions = suggestion_bank
+        active_suggestions = snap.suggestion_bank
 
     scored = []
     for suggestion in active_suggestions:
@@ -0,0 +1,196 @@
+"""
+AWM Institute of Technology — Paraphrase Index (MinHash / LSH)
+===============================================================
+Second-stage matcher used when the keyword scorer finds nothing.
+
+Each QA entry contributes one document built from its keywords, and every
+suggestion that resolves to an entry contributes another built from its
+text and keywords.  Stopwords are dropped, then documents are shingled
+into word unigrams, word bigrams and character trigrams (prefixed w:/b:/c:
+so the types never collide), so reworded questions still share material
+with the entry they mean.
+
+Similarity alone is not enough.  A document only matches if it accounts
+for most of the query's topic words (content words minus GENERIC_WORDS
+like "install" or "request"): each must appear in the document exactly,
+as a prefix either way, or one edit away.  "my keyboard is broken" shares
+"keyboard" with a shortcuts entry but leaves "broken" unexplained, so it
+gets noMatch; "how do i get access to copilot" has a single topic word
+and it is covered.  When two different entries both qualify, the best
+must beat the runner-up by MIN_MARGIN — otherwise the query is ambiguous
+and gets noMatch rather than a coin-flip answer.
+
+Shingle sets are compressed to MinHash signatures and banded into LSH
+buckets; a query only compares against the documents it collides with.
+Below LINEAR_SCAN_MAX documents the banding costs more than it saves, so
+small indexes just scan every document.
+
+MIN_SIMILARITY, MIN_COVERAGE and MIN_MARGIN were tuned on the negatives in
+bench/paraphrase_bench.py and checked against its separate held-out set;
+re-run the bench when changing the shingling or the word lists.
+"""
+
+import random
+import zlib
+
+NUM_PERM = 128
+BANDS = 64
+ROWS = NUM_PERM // BANDS
+MIN_SIMILARITY = 0.2
+MIN_COVERAGE = 2 / 3
+MIN_MARGIN = 0.1
+LINEAR_SCAN_MAX = 500
+
+STOPWORDS = frozenset("""
+    a about an and any are as at be been can could did do does doing for from
+    get getting got had has have how i if in into is it its me my need of on
+    or our should so some that the their them then there these this those to
+    use using want was we were what when where which who why will with would
+    you your
+""".split())
+
+# Kept for similarity, but too generic to make a match on their own
+GENERIC_WORDS = frozenset("""
+    access add build building change create find fix help install installing
+    make new open request requesting set setting setup start up work
+""".split())
+
+# Each "permutation" XORs the base hash with a fixed random mask — cheap
+# enough to keep signatures in C-level min() calls.
+_rng = random.Random(0x5EED)
+_MASKS = [_rng.getrandbits(32) for _ in range(NUM_PERM)]
+
+
+def shingles(text: str) -> set[str]:
+    """Prefixed word unigrams, bigrams and character trigrams of content words."""
+    words = [w for w in text.split() if w not in STOPWORDS]
+    out = {'w:' + w for w in words}
+    out.update('b:' + a + ' ' + b for a, b in zip(words, words[1:]))
+    for w in words:
+        padded = '^' + w + '$'
+        out.update('c:' + padded[i:i + 3] for i in range(len(padded) - 2))
+    return out
+
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """True if a and b differ by one insert, delete, substitution or swap."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        if a[i + 1:] == b[i + 1:]:
+            return True
+        # adjacent transposition: "licnese" / "license"
+        return a[i:i + 2] == b[i + 1:i + 2] + b[i:i + 1] and a[i + 2:] == b[i + 2:]
+    return a[i:] == b[i + 1:]
+
+
+def _word_matches(q: str, d: str) -> bool:
+    if q == d:
+        return True
+    if min(len(q), len(d)) >= 4 and (q.startswith(d) or d.startswith(q)):
+        return True
+    return min(len(q), len(d)) >= 5 and _one_edit_apart(q, d)
+
+
+def topic_coverage(query_words: list[str], doc_words: frozenset[str]) -> float:
+    """Fraction of the query's topic words that the document accounts for."""
+    topic = [w for w in query_words if w not in GENERIC_WORDS]
+    if not topic:
+        return 0.0
+    covered = sum(any(_word_matches(w, d) for d in doc_words) for w in topic)
+    return covered / len(topic)
+
+
+def signature(shingle_set: set[str]) -> tuple[int, ...]:
+    """MinHash signature of a shingle set (NUM_PERM slots)."""
+    hashed = [zlib.crc32(s.encode('utf-8')) for s in shingle_set]
+    if not hashed:
+        return ()
+    return tuple(min(map(mask.__xor__, hashed)) for mask in _MASKS)
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def _band_keys(sig: tuple[int, ...]):
+    for band in range(BANDS):
+        yield band, sig[band * ROWS:(band + 1) * ROWS]
+
+
+class ParaphraseIndex:
+    """LSH index over one scope's QA documents."""
+
+    def __init__(self, documents: list[tuple[dict, str]], banded: bool | None = None):
+        """
+        documents : list of (entry, normalized text) pairs.  Several
+        documents may point at the same entry.
+        banded    : force LSH banding on or off; by default it is used only
+                    above LINEAR_SCAN_MAX documents.
+        """
+        self._entries: list[dict] = []
+        self._shingles: list[set[str]] = []
+        self._words: list[frozenset[str]] = []
+        self._buckets: dict[tuple, list[int]] = {}
+        for entry, text in documents:
+            sh = shingles(text)
+            if sh:
+                self._entries.append(entry)
+                self._shingles.append(sh)
+                self._words.append(frozenset(s[2:] for s in sh if s.startswith('w:')))
+        if banded is None:
+            banded = len(self._entries) > LINEAR_SCAN_MAX
+        self.banded = banded
+        if banded:
+            for idx, sh in enumerate(self._shingles):
+                for key in _band_keys(signature(sh)):
+                    self._buckets.setdefault(key, []).append(idx)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def candidates(self, query_shingles: set[str]) -> set[int]:
+        """Indices of documents sharing at least one LSH band with the query."""
+        if not query_shingles:
+            return set()
+        if not self.banded:
+            return set(range(len(self._entries)))
+        found: set[int] = set()
+        sig = signature(query_shingles)
+        for key in _band_keys(sig):
+            found.update(self._buckets.get(key, ()))
+        return found
+
+    def nearest(self, normalized_query: str,
+                min_similarity: float = MIN_SIMILARITY) -> tuple[dict | None, float]:
+        """Return (entry, similarity) of the closest candidate, or (None, 0.0)."""
+        q = shingles(normalized_query)
+        q_words = [w for w in normalized_query.split() if w not in STOPWORDS]
+        per_entry: dict[int, tuple[float, dict]] = {}
+        for idx in self.candidates(q):
+            sim = jaccard(q, self._shingles[idx])
+            if sim < min_similarity:
+                continue
+            entry = self._entries[idx]
+            prev = per_entry.get(id(entry))
+            if prev and prev[0] >= sim:
+                continue
+            if topic_coverage(q_words, self._words[idx]) < MIN_COVERAGE:
+                continue
+            per_entry[id(entry)] = (sim, entry)
+        if not per_entry:
+            return None, 0.0
+        ranked = sorted(per_entry.values(), key=lambda x: x[0], reverse=True)
+        if len(ranked) > 1 and ranked[0][0] - ranked[1][0] < MIN_MARGIN:
+            return None, 0.0
+        best_sim, best_entry = ranked[0]
+        return best_entry, best_sim
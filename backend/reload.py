@@ -0,0 +1,214 @@
+"""
+AWM Institute of Technology — Content Hot-Reload
+=================================================
+Rebuilds the Q&A banks, module registries and paraphrase indexes from
+their Python modules and publishes them as a new ContentSnapshot.
+
+Two triggers share the same path:
+  - reload_content()     — called by the admin endpoint
+  - ContentWatcher       — background thread polling file mtimes
+
+A failed reload (e.g. a syntax error mid-edit) leaves the current snapshot
+in place; the error is kept in reload_status() and retried on next change.
+"""
+
+import importlib
+import importlib.machinery
+import os
+import sys
+import threading
+import time
+from types import MappingProxyType
+
+from backend import snapshot
+
+# Content roots: the Q&A loader (which also provides .chips) and the
+# module loader.  Everything imported beneath them is re-imported on reload.
+QA_PACKAGE = 'backend.qa'
+MODULES_PACKAGE = 'backend.modules'
+
+WATCH_DIRS = [
+    os.path.join(os.path.dirname(__file__), 'qa'),
+    os.path.join(os.path.dirname(__file__), 'modules'),
+]
+
+# Modules under the content packages that hold code, not content
+_CODE_MODULES = {
+    'backend.qa.engine',
+    'backend.qa.paraphrase',
+}
+
+_reload_lock = threading.Lock()
+_last_error: str | None = None
+
+
+def _is_content(name: str) -> bool:
+    if name in _CODE_MODULES:
+        return False
+    return any(name == root or name.startswith(root + '.')
+               for root in (QA_PACKAGE, MODULES_PACKAGE))
+
+
+class _SourceOnlyLoader(importlib.machinery.SourceFileLoader):
+    """Compile straight from source: never reads or writes .pyc files.
+
+    Bytecode validation is by whole-second mtime and size, which misses
+    quick same-size edits, and reloads shouldn't write to the deployed tree.
+    """
+
+    def get_code(self, fullname):
+        path = self.get_filename(fullname)
+        return self.source_to_code(self.get_data(path), path)
+
+
+class _SourceOnlyFinder:
+    """Meta-path finder that hands content modules to _SourceOnlyLoader."""
+
+    @staticmethod
+    def find_spec(name, path=None, target=None):
+        if not _is_content(name):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(name, path, target)
+        if spec is not None and isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+            spec.loader = _SourceOnlyLoader(name, spec.origin)
+        return spec
+
+
+def _attach(names) -> None:
+    """Point each parent package's attribute at the module in sys.modules."""
+    for name in names:
+        parent, _, child = name.rpartition('.')
+        if name in sys.modules and parent in sys.modules:
+            setattr(sys.modules[parent], child, sys.modules[name])
+
+
+def _reimport_content() -> None:
+    """Drop every loaded content module and import the roots afresh.
+
+    Re-importing from the roots follows the current import graph, so
+    dependencies load before their importers and deleted or renamed files
+    are simply never reached.  On failure the old modules are put back.
+    """
+    old = {name: mod for name, mod in sys.modules.items() if _is_content(name)}
+    for name in old:
+        del sys.modules[name]
+    importlib.invalidate_caches()
+    sys.meta_path.insert(0, _SourceOnlyFinder)
+    try:
+        importlib.import_module(QA_PACKAGE)
+        importlib.import_module(MODULES_PACKAGE)
+    except BaseException:
+        for name in [n for n in sys.modules if _is_content(n)]:
+            del sys.modules[name]
+        sys.modules.update(old)
+        _attach(old)
+        raise
+    finally:
+        sys.meta_path.remove(_SourceOnlyFinder)
+    # Code submodules stay loaded; re-attach them to the new package objects
+    _attach(_CODE_MODULES)
+
+
+def build_snapshot(version: int, reload_modules: bool = True) -> snapshot.ContentSnapshot:
+    """Import (or re-import) all content and build a complete snapshot."""
+    from backend.qa.engine import build_paraphrase_indexes
+
+    start = time.perf_counter()
+    if reload_modules:
+        _reimport_content()
+
+    qa = importlib.import_module(QA_PACKAGE)
+    chips = importlib.import_module(QA_PACKAGE + '.chips')
+    mods = importlib.import_module(MODULES_PACKAGE)
+
+    qa_bank = tuple(qa.qa_bank)
+    suggestion_bank = tuple(qa.suggestion_bank)
+    module_banks = MappingProxyType(dict(qa.module_banks))
+    indexes = build_paraphrase_indexes(qa_bank, suggestion_bank, module_banks)
+
+    return snapshot.ContentSnapshot(
+        version=version,
+        loaded_at=time.time(),
+        reload_ms=(time.perf_counter() - start) * 1000,
+        answer_bank=MappingProxyType(dict(qa.answer_bank)),
+        suggestion_bank=suggestion_bank,
+        qa_bank=qa_bank,
+        video_bank=MappingProxyType(dict(qa.video_bank)),
+        next_questions_bank=MappingProxyType(dict(qa.next_questions_bank)),
+        module_banks=module_banks,
+        answer_module_map=MappingProxyType(dict(qa.answer_module_map)),
+        chips=tuple(chips.CHIPS),
+        modules=MappingProxyType(dict(mods.MODULES)),
+        practices=MappingProxyType(dict(mods.PRACTICES)),
+        paraphrase_indexes=MappingProxyType(indexes),
+    )
+
+
+def reload_content() -> dict:
+    """Rebuild and publish a new snapshot.  Returns reload_status()."""
+    global _last_error
+    with _reload_lock:
+        version = snapshot.current().version + 1
+        try:
+            snap = build_snapshot(version)
+        except Exception as exc:
+            _last_error = f'{type(exc).__name__}: {exc}'
+        else:
+            snapshot.publish(snap)
+            _last_error = None
+    return reload_status()
+
+
+def reload_status() -> dict:
+    """Version, timing and last error of the live snapshot."""
+    snap = snapshot.current()
+    return {
+        'version': snap.version,
+        'loadedAt': snap.loaded_at,
+        'reloadMs': round(snap.reload_ms, 2),
+        'error': _last_error,
+    }
+
+
+def _scan() -> dict[str, float]:
+    """Map every content .py file under WATCH_DIRS to its mtime."""
+    # Code changes need a restart; don't let them look like a reload
+    code_files = {os.path.abspath(sys.modules[n].__file__)
+                  for n in _CODE_MODULES if n in sys.modules}
+    found = {}
+    for root in WATCH_DIRS:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d != '__pycache__']
+            for fn in filenames:
+                path = os.path.join(dirpath, fn)
+                if fn.endswith('.py') and os.path.abspath(path) not in code_files:
+                    try:
+                        found[path] = os.path.getmtime(path)
+                    except OSError:
+                        pass
+    return found
+
+
+class ContentWatcher(threading.Thread):
+    """Daemon thread that reloads content when a watched file changes."""
+
+    def __init__(self, interval: float = 2.0):
+        super().__init__(name='content-watcher', daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        seen = _scan()
+        while not self._stop_event.wait(self.interval):
+            now = _scan()
+            if now != seen:
+                seen = now
+                status = reload_content()
+                if status['error']:
+                    print(f"Content reload failed: {status['error']}")
+                else:
+                    print(f"Content reloaded: v{status['version']} "
+                          f"in {status['reloadMs']} ms")
+
+    def stop(self):
+        self._stop_event.set()
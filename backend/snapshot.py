@@ -0,0 +1,56 @@
+"""
+AWM Institute of Technology — Content Snapshot
+===============================================
+Every request reads Q&A banks, module registries and derived indexes from
+one ContentSnapshot.  A reload builds a complete new snapshot and
+publishes it with a single reference assignment, so a request that grabbed
+the old snapshot keeps a consistent view until it finishes.
+
+Only the top level is frozen: fields are tuples and MappingProxyType, but
+the entry dicts, module dicts and per-module banks inside them are the
+plain objects the content modules built (and are handed straight to
+jsonify / templates).  Treat them as read-only — a reload always builds
+fresh objects, so nothing ever needs to mutate a published snapshot.
+"""
+
+import threading
+from typing import Mapping, NamedTuple
+
+
+class ContentSnapshot(NamedTuple):
+    version: int
+    loaded_at: float          # time.time() when published
+    reload_ms: float          # how long the build took
+    answer_bank: Mapping
+    suggestion_bank: tuple
+    qa_bank: tuple
+    video_bank: Mapping
+    next_questions_bank: Mapping
+    module_banks: Mapping
+    answer_module_map: Mapping
+    chips: tuple
+    modules: Mapping
+    practices: Mapping
+    paraphrase_indexes: Mapping  # scope (module slug or None) -> ParaphraseIndex
+
+
+_current: ContentSnapshot | None = None
+_init_lock = threading.Lock()
+
+
+def current() -> ContentSnapshot:
+    """Return the live snapshot, building the first one on demand."""
+    snap = _current
+    if snap is None:
+        with _init_lock:
+            if _current is None:
+                from backend.reload import build_snapshot
+                publish(build_snapshot(version=1, reload_modules=False))
+            snap = _current
+    return snap
+
+
+def publish(snap: ContentSnapshot) -> None:
+    """Swap in a new snapshot (one atomic reference assignment)."""
+    global _current
+    _current = snap
@@ -0,0 +1,217 @@
+"""
+AWM Institute of Technology — Paraphrase Index Benchmark
+=========================================================
+Calibration, recall and latency of the paraphrase fallback.
+
+1. Calibration — a small bank phrased like the real content, with reworded
+   on-topic questions (positives) and off-topic questions that share the
+   bank's stopwords and phrasing.  NEGATIVES were used to tune
+   MIN_SIMILARITY / MIN_COVERAGE / MIN_MARGIN; HELD_OUT was written
+   separately and must not be tuned against.  Prints, per threshold,
+   recall, wrong answers on positives, and both false-match rates.
+2. Scaling — synthetic banks of increasing size.  The same matcher runs
+   with LSH banding forced on and off, so the columns differ only in how
+   candidates are found.
+
+    python -m bench.paraphrase_bench
+"""
+
+import random
+import string
+import time
+
+from backend.qa.engine import normalize, build_paraphrase_indexes
+from backend.qa.paraphrase import (
+    MIN_COVERAGE, MIN_MARGIN, MIN_SIMILARITY, ParaphraseIndex, shingles,
+)
+
+# -- Calibration set ------------------------------------------------
+
+BANK = [
+    (['request', 'copilot', 'license'], 'How do I request a Copilot license?',
+     ['how do i get access to copilot', 'requesting copilot licence',
+      'where can i apply for a copilot licence']),
+    (['install', 'copilot', 'extension', 'vscode'], 'How do I install Copilot?',
+     ['setting up the copilot extension in vs code', 'installing copilot plugin']),
+    (['keyboard', 'shortcuts', 'hotkeys'], 'What are the keyboard shortcuts?',
+     ['which hotkeys accept a suggestion', 'keyboard shortcut list']),
+    (['inline', 'chat'], 'How do I use inline chat?',
+     ['open the inline chatbox', 'chatting inline in the editor']),
+    (['seal', 'id', '106135'], 'What is the Seal ID for Copilot?',
+     ['which seal number do i search for', 'seal id lookup']),
+    (['mytechhub', 'technology', 'support', 'request'], 'Where do I find myTechHub?',
+     ['open mytechhub support page', 'technology support request form']),
+    (['smartsdk', 'building', 'agents'], 'How do I build with SmartSDK?',
+     ['building an agent using smartsdk', 'smart sdk agent tutorial']),
+    (['stratos', 'setup', 'workflows'], 'How do I set up Stratos?',
+     ['stratos workflow configuration', 'setting up stratos']),
+    (['flask', 'dashboard', 'practice'], 'How do I build the Flask dashboard?',
+     ['flask dashboard exercise', 'dashboards with flask']),
+    (['prompt', 'engineering', 'prompts'], 'What is prompt engineering?',
+     ['writing better prompts', 'engineering a prompt for copilot']),
+]
+
+NEGATIVES = [
+    'how do i cook pasta', 'what are the opening hours', 'what is the weather',
+    'how do i reset my password for email', 'where is the cafeteria',
+    'what time is the meeting', 'how do i book a vacation day',
+    'can you tell me a joke', 'what is the capital of france',
+    'how do i install a printer', 'how do i request a parking permit',
+    'what are the holiday dates', 'how do i fix my laptop screen',
+    'who is the ceo', 'how do i change my desk phone',
+    'what is the wifi password', 'where do i find payroll',
+    'how do i set up my monitor', 'what are the office rules',
+    'how do i submit an expense report', 'what is machine learning',
+    'how do i build a house', 'how do i access my email',
+    'what is the dress code', 'how do i get a new badge',
+    # share a topic word, different intent
+    'where can i buy a flask for coffee', 'my keyboard is broken',
+    'how do i chat with hr', 'is a copilot the same as a pilot',
+    'what is a seal animal', 'who runs technology at the company',
+    'what engineering teams are hiring', 'how big is the dashboard of a car',
+]
+
+HELD_OUT = [
+    'how do i renew my parking license', 'what is a copilot in aviation',
+    'where do i buy a new keyboard', 'how do i chat with my manager',
+    'can you recommend a flask of wine', 'what is the seal of the company',
+    'how do i request a license plate', 'who is the technology director',
+    'how do i set up a prompt for the exam', 'best dashboard camera for cars',
+    'is stratos a cloud type', 'how do i install windows updates',
+    'what are the shortcuts to the office', 'where do i find my pay stub',
+    'what is the wifi network name', 'how do i get access to the building',
+    'inline skating lessons', 'agents for travel booking',
+    'support group meeting times', 'engineering degree requirements',
+]
+
+
+def _calibration_index():
+    qa = [{'keywords': kw, 'answer': f'cal-{n}'} for n, (kw, _, _) in enumerate(BANK)]
+    suggestions = [{'text': text, 'keywords': kw} for kw, text, _ in BANK]
+    return qa, build_paraphrase_indexes(qa, suggestions, {})[None]
+
+
+def calibrate(threshold: float) -> tuple[float, float, float, float]:
+    """Return (recall, wrong, false, held-out false) rates at a threshold."""
+    qa, index = _calibration_index()
+    right = wrong = total = 0
+    for entry, (_, _, paraphrases) in zip(qa, BANK):
+        for text in paraphrases:
+            got, _ = index.nearest(normalize(text), min_similarity=threshold)
+            total += 1
+            right += got is entry
+            wrong += got is not None and got is not entry
+
+    def false_rate(queries):
+        hits = sum(index.nearest(normalize(t), min_similarity=threshold)[0] is not None
+                   for t in queries)
+        return hits / len(queries)
+
+    return right / total, wrong / total, false_rate(NEGATIVES), false_rate(HELD_OUT)
+
+
+# -- Scaling set ----------------------------------------------------
+
+TEMPLATES = ['how do i {} the {}', 'what is {} {}', 'where can i find {} {}',
+             'how can i {} my {}']
+OFF_TOPIC = [normalize(t) for t in NEGATIVES + HELD_OUT]
+
+
+def _word(rng: random.Random) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    if len(word) < 4:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def synthetic_bank(size: int, rng: random.Random):
+    """Return (qa_entries, suggestions) with `size` entries over a shared vocabulary."""
+    vocab = [_word(rng) for _ in range(max(200, size))]
+    qa, suggestions = [], []
+    for n in range(size):
+        keywords = rng.sample(vocab, rng.randint(4, 6))
+        qa.append({'keywords': keywords, 'answer': f'synthetic-{n}'})
+        text = rng.choice(TEMPLATES).format(*keywords[:2])
+        suggestions.append({'text': text, 'keywords': keywords[:3]})
+    return qa, suggestions
+
+
+def paraphrase(rng: random.Random, entry: dict) -> str:
+    """Reword an entry: drop keywords, swap letters, wrap in question phrasing."""
+    kept = rng.sample(entry['keywords'], max(2, len(entry['keywords']) // 2))
+    kept = [_typo(rng, w) if rng.random() < 0.5 else w for w in kept]
+    rng.shuffle(kept)
+    return normalize(rng.choice(TEMPLATES).format(kept[0], ' '.join(kept[1:])))
+
+
+def run(size: int, queries: int = 500, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    qa, suggestions = synthetic_bank(size, rng)
+    documents = [(e, normalize(' '.join(e['keywords']))) for e in qa]
+    documents += [(e, normalize(s['text'])) for e, s in zip(qa, suggestions)]
+
+    t0 = time.perf_counter()
+    index = ParaphraseIndex(documents, banded=True)
+    build_ms = (time.perf_counter() - t0) * 1000
+    linear = ParaphraseIndex(documents, banded=False)
+
+    targets = [rng.choice(qa) for _ in range(queries)]
+    texts = [paraphrase(rng, e) for e in targets]
+
+    lsh_hits = brute_hits = 0
+    lsh_time = brute_time = 0.0
+    candidates = 0
+    for target, text in zip(targets, texts):
+        t0 = time.perf_counter()
+        entry, _ = index.nearest(text)
+        lsh_time += time.perf_counter() - t0
+        lsh_hits += entry is target
+        candidates += len(index.candidates(shingles(text)))
+
+        t0 = time.perf_counter()
+        entry, _ = linear.nearest(text)
+        brute_time += time.perf_counter() - t0
+        brute_hits += entry is target
+
+    false_hits = sum(index.nearest(text)[0] is not None for text in OFF_TOPIC)
+
+    return {
+        'size': size,
+        'build_ms': build_ms,
+        'lsh_recall': lsh_hits / queries,
+        'brute_recall': brute_hits / queries,
+        'lsh_us': lsh_time / queries * 1e6,
+        'brute_us': brute_time / queries * 1e6,
+        'avg_candidates': candidates / queries,
+        'false_rate': false_hits / len(OFF_TOPIC),
+        'documents': len(index),
+    }
+
+
+def main():
+    print(f'Calibration: {sum(len(p) for _, _, p in BANK)} positives, '
+          f'{len(NEGATIVES)} tuning negatives, {len(HELD_OUT)} held-out negatives '
+          f'(MIN_SIMILARITY {MIN_SIMILARITY}, MIN_COVERAGE {MIN_COVERAGE:.2f}, '
+          f'MIN_MARGIN {MIN_MARGIN})')
+    print(f"{'threshold':>10} {'recall':>7} {'wrong':>6} {'false':>6} {'held-out':>9}")
+    for thr in (0.10, 0.15, 0.20, 0.25, 0.30, 0.35, 0.40):
+        recall, wrong, false, held = calibrate(thr)
+        print(f'{thr:>10.2f} {recall:>7.3f} {wrong:>6.3f} {false:>6.3f} {held:>9.3f}')
+    print()
+
+    print('Scaling (same matcher, LSH banding on vs off):')
+    print(f"{'entries':>8} {'docs':>6} {'build ms':>9} {'cands':>7} "
+          f"{'lsh rec':>8} {'scan rec':>9} {'false':>6} {'lsh us':>8} {'scan us':>9}")
+    for size in (20, 100, 1000, 5000):
+        r = run(size)
+        print(f"{r['size']:>8} {r['documents']:>6} {r['build_ms']:>9.1f} "
+              f"{r['avg_candidates']:>7.1f} {r['lsh_recall']:>8.3f} "
+              f"{r['brute_recall']:>9.3f} {r['false_rate']:>6.3f} {r['lsh_us']:>8.1f} {r['brute_us']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
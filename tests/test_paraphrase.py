@@ -0,0 +1,105 @@
+"""
+Paraphrase fallback in resolve_query.
+
+Queries below are chosen to score under 5 with the keyword scorer (typos,
+no shared keyword prefixes) so they actually reach the fallback.
+"""
+
+import pytest
+
+from backend import snapshot
+from backend.qa import paraphrase
+from backend.qa.engine import build_paraphrase_indexes, normalize, resolve_query
+
+QA = [
+    {'keywords': ['request', 'copilot', 'license'], 'answer': 'a-license'},
+    {'keywords': ['keyboard', 'shortcuts', 'hotkeys'], 'answer': 'a-shortcuts'},
+]
+SUGGESTIONS = [
+    {'text': 'How do I request a Copilot license?', 'keywords': ['request', 'copilot', 'license']},
+    {'text': 'What are the keyboard shortcuts?', 'keywords': ['keyboard', 'shortcuts']},
+]
+ANSWERS = {'a-license': 'Request it in myTechHub.', 'a-shortcuts': 'Tab accepts.'}
+MODULE_BANKS = {
+    'flask-dashboard': {
+        'answers': {'a-flask': 'Start with app.py.'},
+        'qa_entries': [{'keywords': ['flask', 'dashboard', 'practice'], 'answer': 'a-flask'}],
+        'suggestions': [{'text': 'How do I build the Flask dashboard?',
+                         'keywords': ['flask', 'dashboard']}],
+    },
+}
+
+
+def _snapshot():
+    return snapshot.ContentSnapshot(
+        version=1, loaded_at=0.0, reload_ms=0.0,
+        answer_bank=ANSWERS, suggestion_bank=tuple(SUGGESTIONS), qa_bank=tuple(QA),
+        video_bank={}, next_questions_bank={}, module_banks=MODULE_BANKS,
+        answer_module_map={}, chips=(), modules={}, practices={},
+        paraphrase_indexes=build_paraphrase_indexes(QA, SUGGESTIONS, MODULE_BANKS),
+    )
+
+
+@pytest.fixture(autouse=True)
+def content(monkeypatch):
+    snap = _snapshot()
+    monkeypatch.setattr(snapshot, '_current', snap)
+    return snap
+
+
+def test_request_example_resolves():
+    index = build_paraphrase_indexes(QA, SUGGESTIONS, {})[None]
+    for query in ('how do i get access to copilot', 'copilot licence'):
+        entry, _ = index.nearest(normalize(query))
+        assert entry is QA[0], query
+
+
+@pytest.mark.parametrize('query, answer_id', [
+    ('copliot licnese requets', 'a-license'),
+    ('keybaord shortcust', 'a-shortcuts'),
+])
+def test_reworded_query_resolves(query, answer_id):
+    result = resolve_query(query)
+    assert result['type'] == 'answer'
+    assert result['answerId'] == answer_id
+
+
+@pytest.mark.parametrize('query', [
+    'my keybaord is broken',
+    'how do i cook pasta',
+    'what are the opening hours',
+    'what is the weather',
+])
+def test_off_topic_query_gets_no_match(query):
+    assert resolve_query(query) == {'type': 'noMatch'}
+
+
+def test_keyword_hit_skips_fallback(content, monkeypatch):
+    class Boom:
+        def nearest(self, *args, **kwargs):
+            raise AssertionError('paraphrase index consulted on a keyword hit')
+
+    monkeypatch.setattr(snapshot, '_current', content._replace(
+        paraphrase_indexes={None: Boom(), 'flask-dashboard': Boom()}))
+    assert resolve_query('keyboard shortcuts')['answerId'] == 'a-shortcuts'
+
+
+def test_module_scope_only_returns_own_entries():
+    indexes = build_paraphrase_indexes(QA, SUGGESTIONS, MODULE_BANKS)
+    module_index = indexes['flask-dashboard']
+    entry, _ = module_index.nearest(normalize('flsak dashbaord'))
+    assert entry is MODULE_BANKS['flask-dashboard']['qa_entries'][0]
+    assert module_index.nearest(normalize('keybaord shortcust')) == (None, 0.0)
+    assert indexes[None].nearest(normalize('flsak dashbaord')) == (None, 0.0)
+
+    result = resolve_query('flsak dashbaord', module_slug='flask-dashboard')
+    assert result['answerId'] == 'a-flask'
+    assert resolve_query('keybaord shortcust', module_slug='flask-dashboard') == {'type': 'noMatch'}
+
+
+def test_ambiguous_match_gets_no_match(monkeypatch):
+    qa = QA + [{'keywords': ['install', 'copilot', 'extension'], 'answer': 'a-install'}]
+    index = build_paraphrase_indexes(qa, [], {})[None]
+    assert index.nearest('copilot', min_similarity=0.0) == (None, 0.0)
+    monkeypatch.setattr(paraphrase, 'MIN_MARGIN', 0.0)
+    assert index.nearest('copilot', min_similarity=0.0)[0] is not None
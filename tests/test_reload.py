@@ -0,0 +1,137 @@
+"""
+Hot-reload tests against a throwaway content package in tmp_path.
+
+Layout mirrors backend/qa and backend/modules: a Q&A loader that imports a
+leaf bank, and a module registry that imports the same leaf.
+"""
+
+import sys
+import threading
+
+import pytest
+
+from backend import reload, snapshot
+from backend.qa.engine import resolve_query
+
+PKG = 'fakecontent'
+
+
+def _write(root, n, leaf='general', broken=False):
+    pkg = root / PKG
+    (pkg / 'qa').mkdir(parents=True, exist_ok=True)
+    (pkg / 'modules').mkdir(parents=True, exist_ok=True)
+    (pkg / '__init__.py').write_text('')
+    (pkg / 'qa' / 'chips.py').write_text('CHIPS = []\n')
+    (pkg / 'qa' / f'{leaf}.py').write_text(
+        ('VERSION = (\n' if broken else f'VERSION = {n}\n')
+        + "ANSWERS = {'a1': f'answer v{VERSION}'}\n"
+        + "QA_ENTRIES = [{'keywords': ['copilot', 'license'], 'answer': 'a1'}]\n"
+        + "NEXT_QUESTIONS = {'a1': [f'next v{VERSION}']}\n"
+    )
+    (pkg / 'qa' / '__init__.py').write_text(
+        f'from {PKG}.qa.{leaf} import ANSWERS, QA_ENTRIES, NEXT_QUESTIONS\n'
+        'answer_bank = dict(ANSWERS)\n'
+        'suggestion_bank = []\n'
+        'qa_bank = list(QA_ENTRIES)\n'
+        'video_bank = {}\n'
+        'next_questions_bank = dict(NEXT_QUESTIONS)\n'
+        'module_banks = {}\n'
+        'answer_module_map = {}\n'
+    )
+    (pkg / 'modules' / 'registry.py').write_text(
+        f'from {PKG}.qa.{leaf} import VERSION\n'
+        "MODULE = {'title': f'module v{VERSION}'}\n"
+    )
+    (pkg / 'modules' / '__init__.py').write_text(
+        f'from {PKG}.modules.registry import MODULE\n'
+        "MODULES = {'demo': MODULE}\n"
+        'PRACTICES = {}\n'
+    )
+
+
+@pytest.fixture
+def content(tmp_path, monkeypatch):
+    _write(tmp_path, 0)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(reload, 'QA_PACKAGE', f'{PKG}.qa')
+    monkeypatch.setattr(reload, 'MODULES_PACKAGE', f'{PKG}.modules')
+    monkeypatch.setattr(reload, 'WATCH_DIRS', [str(tmp_path / PKG)])
+    monkeypatch.setattr(reload, '_last_error', None)
+    monkeypatch.setattr(snapshot, '_current', None)
+    yield tmp_path
+    for name in [n for n in sys.modules if n == PKG or n.startswith(PKG + '.')]:
+        del sys.modules[name]
+
+
+def _version_of(result):
+    """Version named by a response; answer and next questions must agree."""
+    assert result['type'] == 'answer', result
+    answer_v = int(result['text'].rsplit('v', 1)[1])
+    next_v = int(result['nextQuestions'][0].rsplit('v', 1)[1])
+    assert answer_v == next_v, result
+    return answer_v
+
+
+def test_queries_served_during_repeated_reloads(content):
+    assert _version_of(resolve_query('copilot license')) == 0
+    stop = threading.Event()
+    errors = []
+    served = []
+
+    def worker():
+        last = -1
+        try:
+            while not stop.is_set():
+                v = _version_of(resolve_query('copilot license'))
+                assert v >= last, (v, last)
+                last = v
+                served.append(v)
+        except Exception as exc:  # surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    versions = []
+    try:
+        for n in range(1, 21):
+            _write(content, n)
+            status = reload.reload_content()
+            assert status['error'] is None
+            versions.append(status['version'])
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+
+    assert errors == []
+    assert served
+    assert versions == sorted(versions) and len(set(versions)) == len(versions)
+    assert _version_of(resolve_query('copilot license')) == 20
+    assert snapshot.current().modules['demo']['title'] == 'module v20'
+
+
+def test_reload_after_module_renamed(content):
+    snapshot.current()
+    (content / PKG / 'qa' / 'general.py').unlink()
+    _write(content, 1, leaf='support')
+    status = reload.reload_content()
+    assert status['error'] is None
+    assert status['version'] == 2
+    assert _version_of(resolve_query('copilot license')) == 1
+    assert f'{PKG}.qa.general' not in sys.modules
+
+
+def test_failed_reload_keeps_current_snapshot(content):
+    snapshot.current()
+    _write(content, 1, broken=True)
+    status = reload.reload_content()
+    assert status['error'].startswith('SyntaxError')
+    assert status['version'] == 1
+    assert _version_of(resolve_query('copilot license')) == 0
+
+    _write(content, 2)
+    status = reload.reload_content()
+    assert status['error'] is None
+    assert status['version'] == 2
+    assert _version_of(resolve_query('copilot license')) == 2